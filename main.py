@@ -19,8 +19,16 @@ def main():
     parser.add_argument('--visualize', '-v', action='store_true', help='Generate visualization')
     parser.add_argument('--method', '-m', choices=['pdfplumber', 'pymupdf'], default='pymupdf', 
                        help='PDF processing method')
+    parser.add_argument('--boilerplate', '-b', choices=['tag', 'skip'], default=None,
+                       help='Parse title blocks/legends repeated across pages once, then tag or skip them (pymupdf only)')
+    parser.add_argument('--boilerplate-min-pages', type=int, default=None,
+                       help='Pages a span must repeat on to count as boilerplate (default: half the pages, '
+                            'at least 3). Lower values catch more title blocks but risk treating plan '
+                            'content repeated across sheets as boilerplate')
     
     args = parser.parse_args()
+    if args.boilerplate and args.method == 'pdfplumber':
+        parser.error('--boilerplate is only supported with --method pymupdf')
     logger = setup_logging()
     
     # Ensure directories exist
@@ -38,7 +46,8 @@ def main():
         args.output = generate_output_filename(args.pdf_path)
     
     # Process PDF
-    processor = PDFProcessor()
+    processor = PDFProcessor(boilerplate_mode=args.boilerplate,
+                             boilerplate_min_pages=args.boilerplate_min_pages)
     
     if args.method == 'pdfplumber':
         results = processor.extract_with_pdfplumber(args.pdf_path)
@@ -50,6 +59,7 @@ def main():
         "processed_at": datetime.now().isoformat(),
         "pdf_file": os.path.basename(args.pdf_path),
         "processing_method": args.method,
+        "boilerplate_mode": args.boilerplate,
         "total_pages": len(results["pages"])
     }
     
@@ -71,6 +81,11 @@ def main():
     total_codes = sum(len(page["codes"]) for page in results["pages"])
     
     logger.info(f"Extraction completed: {total_dimensions} dimensions, {total_codes} codes found")
+    
+    shared = results.get("shared")
+    if shared:
+        logger.info(f"Shared boilerplate: {len(shared['dimensions'])} dimensions, "
+                    f"{len(shared['codes'])} codes (reported once under 'shared')")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
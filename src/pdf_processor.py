@@ -1,16 +1,39 @@
 import pdfplumber
 import fitz  # PyMuPDF
-from typing import Dict, List, Tuple
+import math
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
 from .dimension_parser import DimensionParser
 from .code_detector import CodeDetector
 
 class PDFProcessor:
-    def __init__(self):
+    BOILERPLATE_MODES = ("tag", "skip")
+
+    def __init__(self, boilerplate_mode: Optional[str] = None,
+                 boilerplate_min_pages: Optional[int] = None, position_tolerance: float = 3.0):
+        """
+        boilerplate_mode: None to process every span on every page, "tag" to keep
+        repeated title-block/legend spans on each page marked as shared, or "skip"
+        to report them once under the top-level "shared" key only.
+        boilerplate_min_pages: pages a span must repeat on to count as boilerplate.
+        Defaults to half the pages, but never fewer than 3, so plan content repeated
+        on a couple of sheets is not mistaken for a title block.
+        position_tolerance: max distance in points between bbox edges of repeated spans.
+        """
+        if boilerplate_mode is not None and boilerplate_mode not in self.BOILERPLATE_MODES:
+            raise ValueError(f"Unknown boilerplate mode: {boilerplate_mode}")
+        
         self.dimension_parser = DimensionParser()
         self.code_detector = CodeDetector()
+        self.boilerplate_mode = boilerplate_mode
+        self.boilerplate_min_pages = boilerplate_min_pages
+        self.position_tolerance = position_tolerance
     
     def extract_with_pdfplumber(self, pdf_path: str) -> Dict:
         """Extract text and metadata using pdfplumber"""
+        if self.boilerplate_mode is not None:
+            raise ValueError("Boilerplate suppression is only supported with PyMuPDF")
+        
         results = {"pages": []}
         
         try:
@@ -30,10 +53,13 @@ class PDFProcessor:
         
         try:
             doc = fitz.open(pdf_path)
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                page_data = self.process_page_pymupdf(page, page_num + 1)
-                results["pages"].append(page_data)
+            if self.boilerplate_mode is not None:
+                self.extract_pages_with_boilerplate(doc, results)
+            else:
+                for page_num in range(len(doc)):
+                    page = doc[page_num]
+                    page_data = self.process_page_pymupdf(page, page_num + 1)
+                    results["pages"].append(page_data)
             
             doc.close()
             return results
@@ -72,26 +98,114 @@ class PDFProcessor:
         dimensions = []
         all_codes = []
         
-        # Extract text blocks with bounding boxes
+        # Extract text spans with bounding boxes [x0, y0, x1, y1]
+        for text, bbox in self.iter_page_spans(page):
+            dims, codes = self.parse_span(text, bbox)
+            dimensions.extend(dims)
+            all_codes.extend(codes)
+        
+        return {
+            "page": page_num,
+            "dimensions": dimensions,
+            "codes": list(set(all_codes))
+        }
+    
+    def iter_page_spans(self, page):
+        """Yield (text, bbox) for every text span on a PyMuPDF page"""
         blocks = page.get_text("dict")["blocks"]
         
         for block in blocks:
             if "lines" in block:
                 for line in block["lines"]:
                     for span in line["spans"]:
-                        text = span["text"]
-                        bbox = span["bbox"]  # [x0, y0, x1, y1]
-                        
-                        # Extract dimensions
-                        dims = self.dimension_parser.extract_dimensions_from_text(text, bbox)
-                        dimensions.extend(dims)
-                        
-                        # Extract codes
-                        codes = self.code_detector.detect_codes(text)
-                        all_codes.extend(codes)
+                        yield span["text"], span["bbox"]
+    
+    def span_fingerprint(self, text: str, bbox, known_positions: Dict[str, List]) -> Tuple:
+        """Fingerprint a span by its text and the first known position within tolerance"""
+        key = text.strip()
+        positions = known_positions.setdefault(key, [])
         
-        return {
-            "page": page_num,
-            "dimensions": dimensions,
-            "codes": list(set(all_codes))
-        }
\ No newline at end of file
+        for index, known_bbox in enumerate(positions):
+            if all(abs(a - b) <= self.position_tolerance for a, b in zip(bbox, known_bbox)):
+                return (key, index)
+        
+        positions.append(tuple(bbox))
+        return (key, len(positions) - 1)
+    
+    def resolve_min_pages(self, page_count: int) -> int:
+        """Number of pages a span must appear on to be treated as boilerplate"""
+        if self.boilerplate_min_pages is not None:
+            return self.boilerplate_min_pages
+        return max(3, math.ceil(page_count / 2))
+    
+    def parse_span(self, text: str, bbox) -> Tuple[List[Dict], List[str]]:
+        """Extract dimensions and codes from a single span"""
+        dims = self.dimension_parser.extract_dimensions_from_text(text, bbox)
+        codes = self.code_detector.detect_codes(text)
+        return dims, codes
+    
+    def extract_pages_with_boilerplate(self, doc, results: Dict):
+        """
+        Process a PyMuPDF document, parsing spans that repeat across pages only once.
+        In tag mode shared dimensions carry "shared": True and shared codes are listed
+        under each page's "shared_codes" instead of "codes".
+        """
+        pages_spans = []
+        page_counts = Counter()
+        known_positions = {}
+        
+        # First pass: fingerprint every span and count the pages it appears on
+        for page_num in range(len(doc)):
+            page = doc[page_num]
+            spans = []
+            for text, bbox in self.iter_page_spans(page):
+                if text.strip():
+                    spans.append((self.span_fingerprint(text, bbox, known_positions), text, bbox))
+            pages_spans.append(spans)
+            page_counts.update({fingerprint for fingerprint, _, _ in spans})
+        
+        min_pages = self.resolve_min_pages(len(doc))
+        boilerplate = {fingerprint for fingerprint, count in page_counts.items()
+                       if count >= min_pages}
+        
+        span_cache = {}
+        shared_dimensions = []
+        shared_codes = []
+        
+        # Second pass: parse page content, consulting the cache for boilerplate spans
+        for page_num, spans in enumerate(pages_spans, 1):
+            dimensions = []
+            all_codes = []
+            page_shared_codes = []
+            
+            for fingerprint, text, bbox in spans:
+                if fingerprint not in boilerplate:
+                    dims, codes = self.parse_span(text, bbox)
+                    dimensions.extend(dims)
+                    all_codes.extend(codes)
+                    continue
+                
+                if fingerprint not in span_cache:
+                    dims, codes = self.parse_span(text, bbox)
+                    span_cache[fingerprint] = (dims, codes)
+                    shared_dimensions.extend(dims)
+                    shared_codes.extend(codes)
+                
+                if self.boilerplate_mode == "tag":
+                    dims, codes = span_cache[fingerprint]
+                    dimensions.extend(dict(dim, bbox=bbox, shared=True) for dim in dims)
+                    page_shared_codes.extend(codes)
+            
+            page_data = {
+                "page": page_num,
+                "dimensions": dimensions,
+                "codes": list(set(all_codes))
+            }
+            if self.boilerplate_mode == "tag":
+                page_data["shared_codes"] = list(set(page_shared_codes))
+            results["pages"].append(page_data)
+        
+        results["shared"] = {
+            "dimensions": shared_dimensions,
+            "codes": list(set(shared_codes))
+        }
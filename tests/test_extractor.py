@@ -1,6 +1,10 @@
+import os
+import tempfile
 import unittest
+import fitz
 from src.dimension_parser import DimensionParser
 from src.code_detector import CodeDetector
+from src.pdf_processor import PDFProcessor
 
 class TestDimensionExtractor(unittest.TestCase):
     def setUp(self):
@@ -27,5 +31,77 @@ class TestDimensionExtractor(unittest.TestCase):
         expected = ['DB24', 'SB42FH', 'MW30']
         self.assertEqual(set(codes), set(expected))
 
+class TestBoilerplateCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.pdf_path = self.build_pdf(title_xs=[50, 50, 50])
+    
+    def build_pdf(self, title_xs):
+        doc = fitz.open()
+        for i, title_x in enumerate(title_xs):
+            page = doc.new_page()
+            page.insert_text((title_x, 700), 'TITLE BLOCK DB24 30"')
+            page.insert_text((100, 100 + i * 50), f'SB42FH {20 + i}"')
+        pdf_path = os.path.join(self.tmp_dir.name, f"plan_{len(os.listdir(self.tmp_dir.name))}.pdf")
+        doc.save(pdf_path)
+        doc.close()
+        return pdf_path
+    
+    def test_tag_mode(self):
+        results = PDFProcessor(boilerplate_mode="tag").extract_with_pymupdf(self.pdf_path)
+        self.assertEqual([d["inches"] for d in results["shared"]["dimensions"]], [30.0])
+        for page in results["pages"]:
+            shared = [d for d in page["dimensions"] if d.get("shared")]
+            self.assertEqual(len(shared), 1)
+            self.assertEqual(len(page["dimensions"]), 2)
+            self.assertEqual(page["codes"], ["SB42FH"])
+            self.assertEqual(page["shared_codes"], ["DB24"])
+    
+    def test_skip_mode(self):
+        results = PDFProcessor(boilerplate_mode="skip").extract_with_pymupdf(self.pdf_path)
+        self.assertEqual(results["shared"]["codes"], ["DB24"])
+        for page in results["pages"]:
+            self.assertEqual(len(page["dimensions"]), 1)
+            self.assertEqual(page["codes"], ["SB42FH"])
+    
+    def test_tag_mode_keeps_page_bbox(self):
+        pdf_path = self.build_pdf(title_xs=[50, 51, 52])
+        results = PDFProcessor(boilerplate_mode="tag").extract_with_pymupdf(pdf_path)
+        self.assertEqual(len(results["shared"]["dimensions"]), 1)
+        
+        doc = fitz.open(pdf_path)
+        for page_data, page in zip(results["pages"], doc):
+            shared = [d for d in page_data["dimensions"] if d.get("shared")]
+            self.assertEqual(len(shared), 1)
+            span_bbox = next(s["bbox"] for b in page.get_text("dict")["blocks"] if "lines" in b
+                             for l in b["lines"] for s in l["spans"] if "TITLE" in s["text"])
+            self.assertEqual(tuple(shared[0]["bbox"]), tuple(span_bbox))
+        doc.close()
+    
+    def test_offset_across_rounding_edge(self):
+        # 2.9/595 and 3.1/595 round to different hundredths of the page width
+        pdf_path = self.build_pdf(title_xs=[2.9, 3.1])
+        results = PDFProcessor(boilerplate_mode="skip", boilerplate_min_pages=2).extract_with_pymupdf(pdf_path)
+        self.assertEqual(results["shared"]["codes"], ["DB24"])
+        for page in results["pages"]:
+            self.assertNotIn("DB24", page["codes"])
+    
+    def test_default_min_pages_keeps_two_page_content(self):
+        pdf_path = self.build_pdf(title_xs=[50, 50])
+        results = PDFProcessor(boilerplate_mode="skip").extract_with_pymupdf(pdf_path)
+        self.assertEqual(results["shared"]["dimensions"], [])
+        for page in results["pages"]:
+            self.assertIn("DB24", page["codes"])
+    
+    def test_pdfplumber_rejects_boilerplate_mode(self):
+        with self.assertRaises(ValueError):
+            PDFProcessor(boilerplate_mode="skip").extract_with_pdfplumber(self.pdf_path)
+    
+    def test_default_mode_unchanged(self):
+        results = PDFProcessor().extract_with_pymupdf(self.pdf_path)
+        self.assertNotIn("shared", results)
+        self.assertTrue(all(len(page["dimensions"]) == 2 for page in results["pages"]))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file